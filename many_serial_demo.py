@@ -1,17 +1,15 @@
 import usb.device
 from usb.device.cdc import CDCInterface
-import select
+import asyncio
 import time
 
 ports = []
 num_ports = 6
-io = select.poll()
 
 # Create a list of CDC objects
 for i in range(num_ports):
 	cdc = CDCInterface()
 	cdc.init(timeout=0)
-	io.register(cdc, select.POLLIN)
 	ports.append(cdc)
 
 # Initialise the USB device with the list of CDC objects
@@ -21,13 +19,21 @@ usb.device.get().init(*ports, builtin_driver=True)
 while not all(port.is_open() for port in ports):
 	time.sleep_ms(100)
 
-while True:
-	# Poll for data on all ports
-	for stream, event in io.ipoll(0):
-		# Read data from the port and write it to all other ports
-		if stream in ports:
-			data = stream.read(256)
-			if data == b'\r':
-				data = b'\r\n'
-			for port in ports:
-				port.write(data)
\ No newline at end of file
+# Forward everything read from one port to all ports
+async def forward(port, writes):
+	stream = asyncio.StreamReader(port)
+	while True:
+		# Wait without spinning until the port has data
+		data = await stream.read(256)
+		if data:
+			# Expand every carriage return in the chunk, not just a lone one
+			data = bytes(data).replace(b'\r', b'\r\n')
+			for write in writes:
+				write(data)
+
+async def main():
+	# Bind the write method of every port once and run a task per port
+	writes = tuple(port.write for port in ports)
+	await asyncio.gather(*(forward(port, writes) for port in ports))
+
+asyncio.run(main())
\ No newline at end of file
@@ -1,6 +1,6 @@
 import usb.device
 from usb.device.cdc import CDCInterface
-from machine import Pin, UART
+from machine import Pin, UART, Timer
 import sys
 import select
 import time
@@ -28,28 +28,49 @@ io = select.poll()
 for port in ports:
 	io.register(port, select.POLLIN)
 
+# Set for fast membership tests and the bound write method of every port
+# except the standard input, which is echoed with print instead
+ports_set = set(ports)
+writes = tuple(port.write for port in ports if port is not sys.stdin)
+
 led = Pin("LED", Pin.OUT)
 led.off()
 
+# Light the LED from a timer so the data path only has to set a flag
+activity = False
+
+def show_activity(timer):
+	global activity
+	led.value(activity)
+	activity = False
+
+led_timer = Timer(period=50, mode=Timer.PERIODIC, callback=show_activity)
+
 # Wait for the USB to be ready
 while not cdc.is_open():
     time.sleep_ms(100)
 
 while True:
-	for stream, event in io.ipoll(0):
-		if stream in ports:
-			led.on()
-			data = stream.read(1)
-			# If the data is a carriage return, add a newline
-			if data == b'\r':
-				data = b'\r\n'
-			for port in ports:
-				# If the port is the standard input, handle it differently
-				if port == sys.stdin:
-					if isinstance(data, str):
-						print(data, end='')
-					else:
-						print(data.decode(), end='')
-					continue
-				port.write(data)
-			led.off()
\ No newline at end of file
+	# Block until a port has data and flag it for the LED
+	events = io.ipoll(-1)
+	activity = True
+	for stream, event in events:
+		if stream in ports_set:
+			# Read the UART and CDC in blocks, standard input blocks until the
+			# full count arrives so it is still read one character at a time
+			data = stream.read(1 if stream is sys.stdin else 256)
+			if not data:
+				continue
+			# Expand every carriage return in the block, not just a lone one,
+			# standard input gives str so it needs a str pattern
+			if isinstance(data, str):
+				data = data.replace('\r', '\r\n')
+			else:
+				data = bytes(data).replace(b'\r', b'\r\n')
+			for write in writes:
+				write(data)
+			# The standard input is echoed to the console instead of written to
+			if isinstance(data, str):
+				print(data, end='')
+			else:
+				print(data.decode(), end='')
\ No newline at end of file